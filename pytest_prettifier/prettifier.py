@@ -31,48 +31,59 @@ import re
 import sys
 from collections import UserDict, UserList, UserString
 from collections.abc import Mapping, Sequence, Set
-from contextlib import suppress
 from datetime import datetime, timedelta
+from functools import cache
 from unittest.mock import Mock
 
-from attrs import asdict, define, field, has
+from attrs import define, field, has
 
 from pytest_prettifier.registry import registry_load
-from pytest_prettifier.timestamp import encode_timestamp
 
 
 def prettify(obj, indent=2, newline="\n", level=0):
     """Return a prettified Python object."""
-    prettifier = Prettifier(indent, newline)
+    prettifier = _get_prettifier(indent, newline)
     return prettifier.prettify(obj, level)
 
 
+@cache
+def _get_prettifier(indent=2, newline="\n"):
+    """Return a shared Prettifier for the given indent and newline."""
+    return Prettifier(indent, newline)
+
+
+@cache
+def _get_default_registry():
+    """Return the registry loaded once from the pytest_prettifier entry points."""
+    return registry_load("pytest_prettifier")
+
+
 def pprettify(obj, *args, **kwargs):
     """Print a prettified Python object to stdout."""
     output = prettify(obj, *args, **kwargs)
     sys.stdout.write(f"{output}\n")
 
 
-@define(frozen=True)
+@define(frozen=True, slots=True)
 class PrettifierPlugin:
     """Plugin for prettifying certain types of value."""
 
     types = field(converter=lambda t: t if isinstance(t, tuple) else (t,))
     prettify = field(repr=False)
+    _types_set = field(init=False, eq=False, repr=False)
+
+    @_types_set.default
+    def _types_set_default(self):
+        return frozenset(self.types)
 
     def priority(self, obj):
-        """Priority of an object from 0 (highest) to -inf (lowest)."""
-        priorities = []
-        for t in self.types:
-            with suppress(ValueError):
-                priorities.append(
-                    -[cls == t for cls in obj.__class__.__mro__].index(True),
-                )
+        """Priority of an object from 0 (highest) downwards, None if no match."""
+        mro = obj.__class__.__mro__
+        types_set = self._types_set
+        if types_set.isdisjoint(mro):
+            return None
 
-        try:
-            return max(priorities)
-        except ValueError:
-            return float("-inf")
+        return -next(index for index, cls in enumerate(mro) if cls in types_set)
 
 
 attrs_prettifier = PrettifierPlugin(
@@ -81,43 +92,51 @@ attrs_prettifier = PrettifierPlugin(
         f"{obj.__class__.__name__}(",
         ", ",
         ")",
-        sorted(
-            "{key}={value}".format(
-                key=p.prettify_record(key, level + 1).rstrip(),
-                value=p.prettify(value, level + 1).lstrip(),
-            )
-            for key, value in asdict(obj, recurse=False).items()
-        ),
+        [
+            f"{attribute.name}={p.prettify_inline(getattr(obj, attribute.name), level + 1)}"
+            # Sorting by name with the separator is the same as sorting the fields.
+            for attribute in sorted(obj.__class__.__attrs_attrs__, key=lambda attribute: f"{attribute.name}=")
+        ],
         level,
     ),
 )
 
 
-bytes_prettifier = PrettifierPlugin(bytes, lambda p, obj, level=0: p.prettify_record(f"{obj!r}", level))
+bytes_prettifier = PrettifierPlugin(bytes, lambda p, obj, level=0: p.prettify_record(repr(obj), level))
+
+
+_encode_timestamp = None
+
+
+def _get_encode_timestamp():
+    """Return encode_timestamp, deferring the import of dateutil until needed."""
+    global _encode_timestamp
+    if _encode_timestamp is None:
+        from pytest_prettifier.timestamp import encode_timestamp as _encode_timestamp
+
+    return _encode_timestamp
 
 
 datetime_prettifier = PrettifierPlugin(
     datetime,
-    lambda p, obj, level=0: p.prettify_record(f"<{encode_timestamp(obj)}>", level),
+    lambda p, obj, level=0: p.prettify_record(f"<{_get_encode_timestamp()(obj)}>", level),
 )
 
 dict_prettifier = PrettifierPlugin(
     (dict, Mapping, UserDict),
     lambda p, obj, level=0: p.prettify_fields(
-        "{}{{".format(
-            "" if isinstance(obj, dict) else f"{obj.__class__.__name__}(",
-        ),
+        "{" if isinstance(obj, dict) else f"{obj.__class__.__name__}({{",
         ", ",
-        "}}{}".format(
-            "" if isinstance(obj, dict) else ")",
-        ),
-        sorted(
-            "{key}: {value}".format(
-                key=p.prettify(key, level + 1).rstrip(),
-                value=p.prettify(value, level + 1).lstrip(),
+        "}" if isinstance(obj, dict) else "})",
+        [
+            f"{key}: {p.prettify_inline(value, level + 1)}"
+            # Sorting by key with the separator is the same as sorting the fields.
+            # The keys keep their indentation for sorting, prettify_fields strips it.
+            for key, value in sorted(
+                ((p.prettify(key, level + 1), value) for key, value in obj.items()),
+                key=lambda item: f"{item[0]}: ",
             )
-            for key, value in obj.items()
-        ),
+        ],
         level,
     ),
 )
@@ -138,28 +157,21 @@ exception_prettifier = PrettifierPlugin(
                 "builtins",
                 "exceptions",
             )
-            else "{}.{}".format(
-                obj.__class__.__module__,
-                obj.__class__.__name__,
-            )
-        ),
+            else f"{obj.__class__.__module__}.{obj.__class__.__name__}"
+        )
+        + p.prettify_inline(getattr(obj, "args", ()), level),
         level,
-    ).rstrip()
-    + p.prettify(getattr(obj, "args", ()), level).lstrip(),
+    ),
 )
 
 
 list_prettifier = PrettifierPlugin(
     (list, Sequence, UserList),
     lambda p, obj, level=0: p.prettify_fields(
-        "{}[".format(
-            "" if isinstance(obj, list) else f"{obj.__class__.__name__}(",
-        ),
+        "[" if isinstance(obj, list) else f"{obj.__class__.__name__}([",
         ", ",
-        "]{}".format(
-            "" if isinstance(obj, list) else ")",
-        ),
-        [p.prettify(item, level + 1) for item in obj],
+        "]" if isinstance(obj, list) else "])",
+        [p.prettify_inline(item, level + 1) for item in obj],
         level,
     ),
 )
@@ -172,10 +184,7 @@ mock_prettifier = PrettifierPlugin(
         ", ",
         ")",
         [
-            "{key}={value}".format(
-                key=p.prettify_record(key, level + 1).rstrip(),
-                value=p.prettify(value, level + 1).lstrip(),
-            )
+            f"{key}={p.prettify_inline(value, level + 1)}"
             for key, value in [
                 (
                     "call_count",
@@ -197,10 +206,16 @@ mock_prettifier = PrettifierPlugin(
 )
 
 
+@cache
+def _has_attrs(cls):
+    """Return whether a class is an attrs class, cached per class."""
+    return has(cls)
+
+
 object_prettifier = PrettifierPlugin(
     object,
     lambda p, obj, level=0: (
-        attrs_prettifier.prettify(p, obj, level) if has(obj) else p.prettify_record(repr(obj), level)
+        attrs_prettifier.prettify(p, obj, level) if _has_attrs(obj.__class__) else p.prettify_record(repr(obj), level)
     ),
 )
 
@@ -217,13 +232,14 @@ set_prettifier = PrettifierPlugin(
         f"{obj.__class__.__name__}([",
         ", ",
         "])",
+        # Sort the items with their indentation, prettify_fields strips it.
         sorted(p.prettify(item, level + 1) for item in obj),
         level,
     ),
 )
 
 
-str_prettifier = PrettifierPlugin((str, UserString), lambda p, obj, level=0: p.prettify_record(f"{obj!r}", level))
+str_prettifier = PrettifierPlugin((str, UserString), lambda p, obj, level=0: p.prettify_record(repr(obj), level))
 
 
 timedelta_prettifier = PrettifierPlugin(
@@ -234,7 +250,11 @@ timedelta_prettifier = PrettifierPlugin(
 
 tuple_prettifier = PrettifierPlugin(
     tuple,
-    lambda p, obj, level=0: p.prettify_fields("(", ", ", ")", [p.prettify(item, level + 1) for item in obj], level),
+    lambda p, obj, level=0: (
+        f"({p.prettify_inline(obj[0], level + 1)})"
+        if len(obj) == 1
+        else p.prettify_fields("(", ", ", ")", [p.prettify_inline(item, level + 1) for item in obj], level)
+    ),
 )
 
 
@@ -258,19 +278,54 @@ type_prettifier = PrettifierPlugin(
 )
 
 
-@define(frozen=True)
+# Plugins for the most common builtin types, looked up by exact type
+# before falling back to the priority of each plugin in the registry.
+_builtin_plugins = {
+    bytes: bytes_prettifier,
+    dict: dict_prettifier,
+    list: list_prettifier,
+    set: set_prettifier,
+    str: str_prettifier,
+    tuple: tuple_prettifier,
+}
+
+
+@define(frozen=True, slots=True)
 class Prettifier:
     """Make a readable version of a value, using plugins."""
 
     indent = field(default=2)
     newline = field(default="\n")
-    registry = field(factory=lambda: registry_load("pytest_prettifier"))
+    registry = field(factory=_get_default_registry)
+    _indent_cache = field(factory=dict, init=False, eq=False, repr=False)
+    _type_cache = field(init=False, eq=False, repr=False)
+
+    @_type_cache.default
+    def _type_cache_default(self):
+        # Only the builtin plugins that are the sole exact match for their
+        # type, other plugins for the same type must still raise a tie.
+        plugins = self._get_plugins()
+        return {
+            cls: plugin
+            for cls, plugin in _builtin_plugins.items()
+            if plugin in plugins and not any(cls in p.types for p in plugins if p != plugin)
+        }
 
     def prettify(self, obj, level=0):
         """Prettify an object using the plugins from the registry."""
         plugin = self.get_plugin(obj)
         return plugin.prettify(self, obj, level).rstrip()
 
+    def prettify_inline(self, obj, level=0):
+        """Prettify an object without indenting its first line.
+
+        This is useful to append the prettified object to a key or a name
+        on the same line.
+        """
+        # Strip the indentation and the newline in a single copy.
+        plugin = self.get_plugin(obj)
+        return plugin.prettify(self, obj, level).strip()
+
     def prettify_fields(self, start, separator, end, fields, level=0):
         """Prettify fields with a start, end, and separators in between.
 
@@ -278,33 +333,17 @@ class Prettifier:
         are more than 1 and one a single line if there are less.
         """
         if len(fields) > 1:
-
-            def sep(index):
-                return separator if index < len(fields) - 1 else ""
-
-            parts = (
-                [
-                    self.prettify_record(start, level),
-                ]
-                + [self.prettify_record(field.strip() + sep(index), level + 1) for index, field in enumerate(fields)]
-                + [
-                    self.prettify_record(end, level).rstrip(),
-                ]
-            )
-        else:
-            parts = (
-                [
-                    start,
-                ]
-                + [
-                    fields[0].strip() if fields else "",
-                ]
-                + [
-                    end,
-                ]
-            )
-
-        return "".join(parts)
+            outer_indent = self._indent_for(level)
+            inner_indent = self._indent_for(level + 1)
+            newline = self.newline
+            last = len(fields) - 1
+            lines = "".join([
+                f"{inner_indent}{field.strip()}{separator if index < last else ''}{newline}"
+                for index, field in enumerate(fields)
+            ])
+            return f"{outer_indent}{start}{newline}{lines}" + (outer_indent + end).rstrip()
+
+        return f"{start}{fields[0].strip() if fields else ''}{end}"
 
     def prettify_record(self, obj, level=0):
         """Prettify a record.
@@ -312,26 +351,50 @@ class Prettifier:
         The prettified record is prefixed with indentation and suffixed
         with a newline.
         """
-        return "{indent}{obj}{newline}".format(
-            indent=" " * self.indent * level,
-            newline=self.newline,
-            obj=obj,
-        )
+        return f"{self._indent_for(level)}{obj}{self.newline}"
+
+    def _indent_for(self, level):
+        indent = self._indent_cache.get(level)
+        if indent is None:
+            indent = self._indent_cache[level] = " " * self.indent * level
+
+        return indent
 
     def get_plugin(self, obj):
-        """Read plugins from pytest_prettifier entrypoint."""
-        prettifiers = self.registry.get("pytest_prettifier", {})
+        """Read plugins from pytest_prettifier entrypoint.
 
-        plugins = {p: p.priority(obj) for p in prettifiers.values()}
-        if not plugins:
+        The plugin only depends on the class of the object, so it is
+        cached per class after the first lookup. The cache is initialized
+        with the builtin plugins for common types found in the registry.
+        """
+        return self._type_cache.get(obj.__class__) or self._find_plugin(obj)
+
+    def _get_plugins(self):
+        # Plugins registered under several names only count once.
+        return dict.fromkeys(self.registry.get("pytest_prettifier", {}).values())
+
+    def _find_plugin(self, obj):
+        prettifiers = self._get_plugins()
+
+        if not prettifiers:
             raise KeyError("No plugins found")
 
-        priority = max(plugins.values())
-        if priority == float("-inf"):
+        priority, plugins = None, []
+        for prettifier in prettifiers:
+            prettifier_priority = prettifier.priority(obj)
+            if prettifier_priority is None:
+                continue
+
+            if priority is None or prettifier_priority > priority:
+                priority, plugins = prettifier_priority, [prettifier]
+            elif prettifier_priority == priority:
+                plugins.append(prettifier)
+
+        if not plugins:
             raise KeyError(f"No matching plugin found for {obj!r}")
 
-        plugins = [k for k, v in plugins.items() if v == priority]
         if len(plugins) > 1:
             raise KeyError(f"More than one plugin found for {obj!r}: {plugins!r}")
 
-        return plugins[0]
+        plugin = self._type_cache[obj.__class__] = plugins[0]
+        return plugin
@@ -10,7 +10,7 @@ Here are examples to decode and encode timestamps:
     True
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from dateutil.parser import parse
 from dateutil.tz import UTC, tz
@@ -38,15 +38,17 @@ def decode_timestamp(timestamp):
 def encode_timestamp(timestamp):
     """Write a timestamp out as a string.
 
-    datetime expects the tzinfo to be tzoffset even if the given timezone
-    does implement the tzinfo abstract class.  Solution is to replace the
-    actual timezone with a tzoffset that takes minutes.
+    A timestamp without a tzinfo is assumed to be UTC.  Timezones with a
+    fixed offset, like timezone, tzoffset and tzutc, are left as is.  Any
+    other tzinfo implementation is replaced with a tzoffset of its offset
+    from UTC, in seconds.
     """
-    if timestamp.tzinfo is not None and not isinstance(timestamp.tzinfo, tz.tzoffset):
-        utcoffset = timestamp.tzinfo.utcoffset(None) // timedelta(seconds=1)
-        timestamp = timestamp.replace(tzinfo=tz.tzoffset(None, utcoffset))
-    elif timestamp.tzinfo is None:
+    tzinfo = timestamp.tzinfo
+    if tzinfo is None:
         timestamp = timestamp.replace(tzinfo=tzutc)
+    elif not isinstance(tzinfo, (timezone, tz.tzoffset, tz.tzutc)):
+        utcoffset = tzinfo.utcoffset(None) // timedelta(seconds=1)
+        timestamp = timestamp.replace(tzinfo=tz.tzoffset(None, utcoffset))
 
     return timestamp.isoformat(timespec="microseconds")
 
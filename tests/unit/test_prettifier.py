@@ -1,6 +1,8 @@
 """Test."""
 
 import re
+import subprocess
+import sys
 from collections.abc import Mapping, Sequence, Set
 from datetime import datetime as dt
 from datetime import timedelta as td
@@ -137,6 +139,24 @@ def prettifier():
                 "}",
             ]),
         ),
+        (
+            {1, (2,)},
+            "\n".join([
+                "set([",
+                "  1, ",
+                "  (2)",
+                "])",
+            ]),
+        ),
+        (
+            {1: "a", (2,): "b"},
+            "\n".join([
+                "{",
+                "  1: 'a', ",
+                "  (2): 'b'",
+                "}",
+            ]),
+        ),
         (make_class("Test", [])(), "Test()"),
         (make_class("Test", ["a"])(1), "Test(a=1)"),
         (make_class("Test", ["a"])({1}), "Test(a=set([1]))"),
@@ -165,6 +185,18 @@ def test_prettify(obj, string):
     assert prettify(obj) == string
 
 
+def test_prettify_shared_prettifier():
+    """Prettifying with the same options should reuse the same prettifier."""
+    prettify("a", indent=0, newline="")
+    with patch("pytest_prettifier.prettifier.Prettifier", side_effect=AssertionError):
+        assert prettify("b", indent=0, newline="") == "'b'"
+
+
+def test_prettifier_default_registry():
+    """The default registry should only be loaded once."""
+    assert Prettifier().registry is Prettifier().registry
+
+
 @patch("sys.stdout")
 def test_pprettify(stdout):
     """Printing a prettified object should write to stdout."""
@@ -190,17 +222,29 @@ def test_pprettify(stdout):
         pytest.param(
             int,
             object(),
-            float("-inf"),
-            id="-inf",
+            None,
+            id="None",
         ),
     ],
 )
 def test_prettifier_plugin_priority(types, obj, priority):
-    """The priority should be 0, -1 or -inf."""
+    """The priority should be 0, -1 or None."""
     plugin = PrettifierPlugin(types, None)
     assert plugin.priority(obj) == priority
 
 
+@pytest.mark.parametrize(
+    "obj",
+    [
+        Prettifier(registry={}),
+        PrettifierPlugin(object, None),
+    ],
+)
+def test_prettifier_slots(obj):
+    """Prettifiers and their plugins should not have an instance dict."""
+    assert not hasattr(obj, "__dict__")
+
+
 @pytest.mark.parametrize(
     "obj, string",
     [
@@ -236,12 +280,20 @@ def test_datetime_prettifier(prettifier, obj, string):
     assert datetime_prettifier.prettify(prettifier, obj) == string
 
 
+def test_datetime_prettifier_deferred_import():
+    """Importing the prettifier should not import dateutil until a datetime is prettified."""
+    code = "import sys, pytest_prettifier.prettifier; sys.exit('dateutil' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], check=False)  # noqa: S603
+    assert result.returncode == 0
+
+
 @pytest.mark.parametrize(
     "obj, string",
     [
         ({}, "{}"),
         ({"a": 1}, "{'a': 1}"),
         ({"a": 1, "b": 2}, "{'a': 1, 'b': 2}"),
+        ({1: "a", 10: "b", 2: "c"}, "{10: 'b', 1: 'a', 2: 'c'}"),
         (StubMapping(), "StubMapping({})"),
     ],
 )
@@ -356,6 +408,7 @@ def test_timedelta_prettifier(prettifier, obj, string):
     [
         ((), "()"),
         ((1,), "(1)"),
+        (((1, "a"),), "((1, 'a'))"),
         ((1, "a"), "(1, 'a')"),
     ],
 )
@@ -378,6 +431,28 @@ def test_type_prettifier(prettifier, obj, string):
     assert type_prettifier.prettify(prettifier, obj) == string
 
 
+@pytest.mark.parametrize(
+    "obj, level, string",
+    [
+        (1, 1, "1"),
+        ([1], 1, "[1]"),
+        (
+            [1, 2],
+            1,
+            "\n".join([
+                "[",
+                "    1, ",
+                "    2",
+                "  ]",
+            ]),
+        ),
+    ],
+)
+def test_prettifier_prettify_inline(obj, level, string):
+    """Prettifying inline should not indent the first line."""
+    assert Prettifier().prettify_inline(obj, level) == string
+
+
 def test_prettifier_get_plugin_priority():
     """Getting a plugin should prioritize the most specific type."""
     prettifier = Prettifier(
@@ -431,3 +506,94 @@ def test_prettifier_get_plugin_more_than_one():
         prettifier.get_plugin("")
 
     assert "More than one" in e.value.args[0]
+
+
+@pytest.mark.parametrize(
+    "obj, plugin",
+    [
+        pytest.param("", str_prettifier, id="builtin"),
+        pytest.param(dt(2000, 1, 1), datetime_prettifier, id="other"),
+    ],
+)
+def test_prettifier_get_plugin_same_plugin_twice(obj, plugin):
+    """Getting a plugin should not raise when it is registered under two names."""
+    prettifier = Prettifier(
+        registry={
+            "pytest_prettifier": {
+                "a": plugin,
+                "b": plugin,
+            },
+        }
+    )
+    assert prettifier.get_plugin(obj) is plugin
+
+
+@pytest.mark.parametrize(
+    "obj, plugin",
+    [
+        pytest.param("", str_prettifier, id="builtin"),
+        pytest.param(dt(2000, 1, 1), datetime_prettifier, id="other"),
+    ],
+)
+def test_prettifier_get_plugin_same_type_twice(obj, plugin):
+    """Getting a plugin should raise when another plugin has the same type."""
+    prettifier = Prettifier(
+        registry={
+            "pytest_prettifier": {
+                "a": plugin,
+                "b": PrettifierPlugin(plugin.types, lambda *_: None),
+            },
+        }
+    )
+    with pytest.raises(KeyError) as e:
+        prettifier.get_plugin(obj)
+
+    assert "More than one" in e.value.args[0]
+
+
+def test_prettifier_get_plugin_cached():
+    """Getting a plugin should cache it for the class of the object."""
+    registry = {
+        "pytest_prettifier": {
+            "str": PrettifierPlugin(str, lambda *_: "str"),
+        },
+    }
+    prettifier = Prettifier(registry=registry)
+    plugin = prettifier.get_plugin("a")
+    registry["pytest_prettifier"].clear()
+    assert prettifier.get_plugin("b") is plugin
+
+
+@pytest.mark.parametrize(
+    "obj, plugin",
+    [
+        ({}, dict_prettifier),
+        (set(), set_prettifier),
+    ],
+)
+def test_prettifier_get_plugin_builtin(obj, plugin):
+    """Getting a plugin for a common builtin type should skip priorities."""
+    prettifier = Prettifier(
+        registry={
+            "pytest_prettifier": {
+                "dict": dict_prettifier,
+                "object": object_prettifier,
+                "set": set_prettifier,
+            },
+        }
+    )
+    with patch.object(PrettifierPlugin, "priority", side_effect=AssertionError):
+        assert prettifier.get_plugin(obj) is plugin
+
+
+def test_prettifier_get_plugin_abc():
+    """Getting a plugin for a subclass of an abstract type should use its plugin."""
+    prettifier = Prettifier(
+        registry={
+            "pytest_prettifier": {
+                "dict": dict_prettifier,
+                "object": object_prettifier,
+            },
+        }
+    )
+    assert prettifier.get_plugin(StubMapping()) is dict_prettifier
@@ -69,7 +69,7 @@ def test_encode_timestamp_without_tzinfo():
 
 
 def test_encode_timestamp_with_tzinfo_as_timezone():
-    """A datetime with tzinfo as should convert it to a tzoffset."""
+    """A datetime with tzinfo as timezone should leave it as is."""
     result = encode_timestamp(datetime(2000, 1, 1, tzinfo=timezone(timedelta(hours=1))))
     assert result == "2000-01-01T00:00:00.000000+01:00"
 
@@ -78,3 +78,22 @@ def test_encode_timestamp_with_tzinfo_as_tzoffset():
     """A datetime with a tzinfo as tzoffset should leave it as is."""
     result = encode_timestamp(datetime(2000, 1, 1, tzinfo=tz.tzoffset(None, 60 * 60)))
     assert result == "2000-01-01T00:00:00.000000+01:00"
+
+
+@pytest.mark.parametrize(
+    "tzinfo",
+    [
+        tzutc,
+        timezone.utc,
+    ],
+)
+def test_encode_timestamp_with_tzinfo_as_utc(tzinfo):
+    """A datetime with a UTC tzinfo should leave it as is."""
+    result = encode_timestamp(datetime(2000, 1, 1, tzinfo=tzinfo))
+    assert result == "2000-01-01T00:00:00.000000+00:00"
+
+
+def test_encode_timestamp_with_tzinfo_as_tzstr():
+    """A datetime with a tzinfo as tzstr should convert it to a tzoffset."""
+    result = encode_timestamp(datetime(2000, 1, 1, tzinfo=tz.tzstr("EST+5")))
+    assert result == "2000-01-01T00:00:00.000000-05:00"